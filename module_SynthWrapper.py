@@ -1,7 +1,29 @@
 import time
+from pathlib import Path
 import serial.tools.list_ports
 from windfreak import SynthHD
 
+PATH_LAST_PORT = Path.home() / ".cache" / "synth_wrapper_port"
+
+
+def load_last_port():
+    """load_last_port() -> str | None
+
+    port name of the last successful connection (None if unknown)
+    """
+    try:
+        return PATH_LAST_PORT.read_text().strip()
+    except OSError:
+        return None
+
+
+def save_last_port(str_port: str):
+    try:
+        PATH_LAST_PORT.parent.mkdir(parents=True, exist_ok=True)
+        PATH_LAST_PORT.write_text(str_port)
+    except OSError:
+        pass
+
 
 class Synth_Wrapper():
     def __init__(self, str_port: str = None, num_port: int = None, debug=False) -> None:
@@ -22,6 +44,10 @@ class Synth_Wrapper():
             return
         if str_port is None:
             list_port = list(serial.tools.list_ports.comports())
+            if num_port is None:
+                # probe the port of the last successful connection first
+                str_last = load_last_port()
+                list_port.sort(key=lambda _port: _port.name != str_last)
             for _i in range(len(list_port)):
                 # print(_i, list_port[_i].name)
                 if num_port is None:
@@ -37,9 +63,14 @@ class Synth_Wrapper():
                         break
             str_port = list_port[num_port].name
         self.synth = SynthHD(str_port)
-        self.synth[0].enable = False
-        self.synth[0].power = 15
-        self.synth[0].frequency = 8.0e9
+        save_last_port(str_port)
+        self.channel = self.synth[0]
+        self.channel.enable = False
+        self.channel.power = 15
+        self.channel.frequency = 8.0e9
+        # last values written to the device, so that on() can skip unchanged settings
+        self.last_power = 15
+        self.last_frequency = 8.0e9
         print("SynthHDWrapper>> Connect to", str_port)
 
     def on(self, power: float = None, frequency: float = None):
@@ -53,11 +84,13 @@ class Synth_Wrapper():
         """
         if self.debug:
             return
-        if power is not None:
-            self.synth[0].power = power
-        if frequency is not None:
-            self.synth[0].frequency = frequency
-        self.synth[0].enable = True
+        if power is not None and power != self.last_power:
+            self.channel.power = power
+            self.last_power = power
+        if frequency is not None and frequency != self.last_frequency:
+            self.channel.frequency = frequency
+            self.last_frequency = frequency
+        self.channel.enable = True
         time.sleep(0.125)  # for signal rise time
 
     def off(self):
@@ -67,7 +100,7 @@ class Synth_Wrapper():
         """
         if self.debug:
             return
-        self.synth[0].enable = False
+        self.channel.enable = False
 
 
 if __name__ == "__main__":
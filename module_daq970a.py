@@ -1,4 +1,4 @@
-from time import time, sleep
+from time import perf_counter, sleep
 import datetime
 import numpy as np
 import pyvisa
@@ -11,10 +11,7 @@ def list_of_channels(str_chan: str):
         return [int(list_num[0]), ]
     if len(list_num) > 2:
         raise ValueError
-    list_channel = []
-    for _i in range(int(list_num[0]), int(list_num[1]) + 1):
-        list_channel.append(_i)
-    return list_channel
+    return list(range(int(list_num[0]), int(list_num[1]) + 1))
 
 
 class Daq970a():
@@ -29,15 +26,23 @@ class Daq970a():
     resolution = 0.1e-6  # 20NPLC
     nplc = 20
     str_chan = "101"
+    conf_applied = None
 
-    def __init__(self, debug=False, verbose=True) -> None:
+    def __init__(self, debug=False, verbose=True, reset=True) -> None:
+        """Daq970a(debug=False, verbose=True, reset=True)
+
+        reset: reset the instrument and its modules on connect
+               (False only skips the reset; the scan list is still cleared
+               and the default configure() is still applied)
+        """
         self.debug = debug
         if debug:
             return
 
         self.refresh_resources()
-        self.connect_device(None, verbose)
-        self.device.system.module.reset_all()
+        self.connect_device(None, verbose, reset)
+        if reset:
+            self.device.system.module.reset_all()
         # print(self.device.utility.error_query())
         self.device.scan.clear_scan_list()
         self.configure("101", 10, 5, 1000e-3, 0.1e-3)
@@ -71,7 +76,7 @@ class Daq970a():
             raise FileNotFoundError("DAQ970Wrapper>> DAQ970A is not found")
         return num_suggest
 
-    def connect_device(self, num=None, verbose=True):
+    def connect_device(self, num=None, verbose=True, reset=True):
         if self.res_man is None:
             raise ValueError("DAQ970Wrapper>> ResourceManager is undefined")
         if self.list_resources is None:
@@ -82,7 +87,6 @@ class Daq970a():
 
         resource_name = self.list_resources[num]
         id_query = True
-        reset = True
         options = ""
 
         self.device = keysight_ktdaq970.KtDAQ970(resource_name, id_query, reset, options)
@@ -119,9 +123,13 @@ class Daq970a():
         if nplc is not None:
             self.nplc = nplc
         # self.device.configure.dc_voltage.configure_auto(self.str_chan)
-        self.device.configure.dc_voltage.configure(self.max_range, self.resolution, self.str_chan)
-        self.device.configure.dc_voltage.set_nplc(self.nplc, self.str_chan)
-        self.device.scan.format.enable_all()
+        conf = (self.str_chan, self.max_range, self.resolution, self.nplc)
+        if conf != self.conf_applied:
+            # skipped when only the trigger settings (sweep_count, sec_scan) change
+            self.device.configure.dc_voltage.configure(self.max_range, self.resolution, self.str_chan)
+            self.device.configure.dc_voltage.set_nplc(self.nplc, self.str_chan)
+            self.device.scan.format.enable_all()
+            self.conf_applied = conf
         if sweep_count is not None:
             self.device.scan.sweep_count = sweep_count
         if sec_scan is not None:
@@ -137,19 +145,18 @@ class Daq970a():
         if self.debug:
             return 0, 0
         _scan = self.device.scan.read(self.time_scan)
-        list_channel_set = list_of_channels(self.str_chan)
-        list_channel = [[] for _i in list_channel_set]
-        for _mea in _scan:
-            _idx = list_channel_set.index(_mea.channel)
-            list_channel[_idx].append(_mea.reading)
-        list_mean = []
-        list_std = []
-        for _list in list_channel:
-            list_mean.append(np.mean(_list))
-            list_std.append(np.std(_list))
-        if len(list_mean) == 1:
-            return list_mean[0], list_std[0]
-        return list_mean, list_std
+        vec_channel_set = np.array(list_of_channels(self.str_chan))
+        num_channel = len(vec_channel_set)
+        # readings come sweep by sweep in scan-list order: rows = sweeps, columns = channels
+        mat_channel = np.array([_mea.channel for _mea in _scan], dtype=int).reshape((-1, num_channel))
+        if (mat_channel != vec_channel_set).any():
+            raise ValueError("DAQ970Wrapper>> Scan data does not match the channel list " + self.str_chan)
+        mat_reading = np.array([_mea.reading for _mea in _scan], dtype=float).reshape((-1, num_channel))
+        vec_mean = mat_reading.mean(axis=0)
+        vec_std = mat_reading.std(axis=0)
+        if num_channel == 1:
+            return vec_mean[0], vec_std[0]
+        return vec_mean.tolist(), vec_std.tolist()
 
     def close(self):
         if self.device is not None:
@@ -159,7 +166,7 @@ class Daq970a():
         self.close()
 
 
-def oscillo(nmax=100, str_chan="101"):
+def oscillo(nmax=100, str_chan="101", sec_redraw=1 / 30):
     from matplotlib import pyplot as plt
     global flag_continue
     global flag_autoscale
@@ -211,16 +218,22 @@ def oscillo(nmax=100, str_chan="101"):
             return
 
     fig.canvas.mpl_connect("key_press_event", pressed)
-    start = time()
+    start = perf_counter()
     flag_continue = True
     flag_autoscale = False
     flag_autoscale_0 = False
+    # times/test are ring buffers: acquisition writes one slot per sample,
+    # the figure is redrawn at most once per sec_redraw
+    idx = 0
+    time_redraw = 0
     while flag_continue:
-        times[0:-1] = times[1:]
-        times[-1] = time() - start
-        test[0:-1] = test[1:]
-        test[-1] = 1000 * daq.measure()[0]
-        lines.set_data(times, test)
+        times[idx] = perf_counter() - start
+        test[idx] = 1000 * daq.measure()[0]
+        idx = (idx + 1) % nmax
+        if times[idx - 1] - time_redraw < sec_redraw:
+            continue
+        time_redraw = times[idx - 1]
+        lines.set_data(np.roll(times, -idx), np.roll(test, -idx))
         if flag_autoscale:
             ax.set_ylim(
                 test.min() - 0.1 * (test.max() - test.min()),
@@ -229,7 +242,7 @@ def oscillo(nmax=100, str_chan="101"):
             ax.set_ylim(
                 0,
                 test.max() * 1.1)
-        ax.set_xlim(np.nanmin(times), np.nanmax(times[-1]))
+        ax.set_xlim(np.nanmin(times), times[idx - 1])
         plt.pause(0.001)
 
 
@@ -246,7 +259,7 @@ if __name__ == "__main__":
     """Test"""
     # from matplotlib import pyplot as plt
     # _max, _min = 0, 1000
-    # start_global = time()
+    # start_global = perf_counter()
     # last_time = 0
     # list_time = []
     # _list_elapse = []
@@ -262,14 +275,14 @@ if __name__ == "__main__":
     # ax1.grid(True)
     # try:
     #     while True:
-    #         start = time()
+    #         start = perf_counter()
     #         _mean, _ = daq.measure()
-    #         elapse = time() - start
+    #         elapse = perf_counter() - start
     #         if _max < elapse:
     #             _max = elapse
     #         if _min > elapse:
     #             _min = elapse
-    #         min_now = (time() - start_global) / 60
+    #         min_now = (perf_counter() - start_global) / 60
     #         # print("\rglobal time: {0:5.1f} min | elapse: {1:3.4f} sec | max: {2:3.4f} sec | min: {3:3.4f} sec".format(min_now, elapse, _max, _min), end="")
     #         ax1.set_title("now: {0:5.1f} min | elapse: {1:3.4f} sec\nmax: {2:3.4f} sec | min: {3:3.4f} sec".format(min_now, elapse, _max, _min))
     #         _list_elapse.append(elapse)
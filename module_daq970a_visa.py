@@ -12,14 +12,22 @@ class Daq970a():
     list_resources = []
     res_man = None
 
-    def __init__(self, ) -> None:
+    def __init__(self, reset=True) -> None:
+        """Daq970a(reset=True)
+
+        reset: send *CLS/*RST after connecting
+               (False keeps the current instrument setup, e.g. on re-connect)
+        """
         self.refresh_resources()
         self.connect_device()
 
-        self.device.write("*CLS")
-        self.device.write("*RST")
+        if reset:
+            self.device.write("*CLS;*RST")
 
         self.flag_scan_ready = False
+        self.flag_scan_started = False
+        self.clear_config_cache()
+        self.flag_srq = self.enable_srq()
 
     def refresh_resources(self):
         """refresh_resources
@@ -61,7 +69,8 @@ class Daq970a():
         if num is None:
             num = self.find_device()
 
-        self.device = self.res_man.open_resource(self.list_resources[num])
+        # large chunk_size: DATA:REMOVE? answers are read in one go instead of 20 kB pieces
+        self.device = self.res_man.open_resource(self.list_resources[num], chunk_size=1024 * 1024)
 
     def query(self, arg):
         _ret = self.device.query(arg)
@@ -70,6 +79,28 @@ class Daq970a():
     def write(self, arg: str):
         self.device.write(arg)
 
+    def enable_srq(self):
+        """enable_srq
+        let the device request service when a scan is complete (*OPC -> ESB -> SRQ),
+        so that wait_scan can wait for the event instead of polling DATA:POINTS?
+        return False if the interface does not support service requests"""
+        try:
+            self.device.enable_event(
+                pyvisa.constants.EventType.service_request,
+                pyvisa.constants.EventMechanism.queue)
+        except (pyvisa.errors.VisaIOError, NotImplementedError):
+            return False
+        self.write("*ESE 1;*SRE 32")
+        return True
+
+    def clear_config_cache(self):
+        """clear_config_cache
+        forget the last channel/scan setup so that the next
+        set_channel_volt_dc/setup_scan is sent to the device again
+        (call this after changing the setup via write())"""
+        self._config_channel = None
+        self._config_count = None
+
     def set_channel_volt_dc(self, list_channel: list):
         """set_channel_volt_dc
         set channel(s) to measure dc volt
@@ -80,12 +111,14 @@ class Daq970a():
         >> daq.set_channel_volt_dc([101, 102, 103])
         """
 
-        self.list_channel = list_channel
-        str_chan = ""
-        for _chan in list_channel:
-            str_chan += str(_chan) + ","
-        self.write("CONF:VOLT:DC (@{0})".format(str_chan[:-1]))
-        self.write("ROUTE:SCAN (@{0})".format(str_chan[:-1]))
+        self.list_channel = list(list_channel)
+        if self.list_channel == self._config_channel:
+            return
+        str_chan = ",".join(map(str, self.list_channel))
+        self.write("CONF:VOLT:DC (@{0});:ROUTE:SCAN (@{0})".format(str_chan))
+        self._config_channel = self.list_channel
+        # CONF resets the trigger count to 1, so setup_scan has to send TRIG:COUNT again
+        self._config_count = None
 
     def setup_scan(self, count=50, interval=0.1):
         """setup_scan
@@ -99,33 +132,86 @@ class Daq970a():
         """
         self.scan_count = count
         self.scan_interval = interval
-        self.write("FORMAT:READING:CHAN ON")
-        self.write("FORMAT:READING:TIME ON")
-        self.write("TRIG:COUNT {0}".format(count))
         self.flag_scan_ready = True
-
-    def scan_single_chan(self, verbose=False):
-        """scan_single_chan
-        return time: ndarray, val: ndarray"""
+        if count == self._config_count:
+            return
+        self.write("FORMAT:READING:CHAN ON;:FORMAT:READING:TIME ON;:TRIG:COUNT {0}".format(count))
+        self._config_count = count
+
+    def start_scan(self, verbose=False):
+        """start_scan
+        trigger a scan (INIT) and return without waiting for it
+
+        scan_single_chan/scan_multi_chan pick up a scan started here,
+        so several devices can acquire at the same time:
+        >> daq1.start_scan()
+        >> daq2.start_scan()
+        >> ret1 = daq1.scan_multi_chan()
+        >> ret2 = daq2.scan_multi_chan()
+        """
         if not self.flag_scan_ready:
-            return None, None
-        self.write("INIT;:SYSTEM:TIME:SCAN?")
+            return
+        if self.flag_srq:
+            self.device.discard_events(
+                pyvisa.constants.EventType.service_request,
+                pyvisa.constants.EventMechanism.queue)
+        # *CLS: a leftover OPC/ESB bit would suppress the end-of-scan SRQ
+        self.write("*CLS;INIT;*OPC;:SYSTEM:TIME:SCAN?")
         _ret = self.device.read().rstrip()
         if verbose:
             print("SCAN:", _ret)
+        self.flag_scan_started = True
+
+    def wait_scan(self, num_points):
+        """wait_scan
+        block until num_points readings are stored in the reading memory
+
+        with service requests enabled, this waits for the end-of-scan SRQ
+        and only asks DATA:POINTS? once a second for the progress bar
+        otherwise DATA:POINTS? is polled, backing off while no new readings arrive
+        (the poll period is derived from scan_interval, which is only a hint:
+        setup_scan does not program it into the device)"""
         points = 0
         points_prev = 0
-        with tqdm(total=self.scan_count, leave=False, desc="[SCAN]") as pbar:
-            while points < self.scan_count:
-                sleep(0.01)
+        if not self.flag_srq:
+            sec_poll_max = max(0.02, min(self.scan_interval * 0.25, 0.2))
+            sec_poll = sec_poll_max / 4
+        with tqdm(total=num_points, leave=False, desc="[SCAN]") as pbar:
+            while points < num_points:
+                if self.flag_srq:
+                    try:
+                        self.device.wait_on_event(pyvisa.constants.EventType.service_request, 1000)
+                    except pyvisa.errors.VisaIOError as e:
+                        if e.error_code != pyvisa.constants.StatusCode.error_timeout:
+                            raise
+                else:
+                    sleep(sec_poll)
                 points = int(self.query("DATA:POINTS?"))
-                if points - points_prev > 0:
+                if points > points_prev:
                     pbar.update(points - points_prev)
                     points_prev = points
-        ret = self.query("DATA:REMOVE? {0}".format(self.scan_count)).rstrip()
+                    if not self.flag_srq:
+                        sec_poll = sec_poll_max / 4
+                elif not self.flag_srq:
+                    sec_poll = min(sec_poll * 2, sec_poll_max)
+        if self.flag_srq:
+            # clear the request and the OPC bit, also when the loop ended on DATA:POINTS?
+            self.device.read_stb()
+            self.query("*ESR?")
+        self.flag_scan_started = False
+
+    def scan_single_chan(self, verbose=False):
+        """scan_single_chan
+        return time: ndarray, val: ndarray"""
+        if not self.flag_scan_ready:
+            return None, None
+        if not self.flag_scan_started:
+            self.start_scan(verbose)
+        self.wait_scan(self.scan_count)
+        mat = self.device.query_ascii_values(
+            "DATA:REMOVE? {0}".format(self.scan_count), container=np.ndarray).reshape((-1, 3))
         if verbose:
-            print(ret)
-        mat = np.array(ret.split(sep=","), dtype=float).reshape((-1, 3))
+            print(mat)
         return mat[:, 1], mat[:, 0]  # _t, _val
 
     def scan_multi_chan(self, verbose=False):
@@ -148,41 +234,19 @@ class Daq970a():
 
         if not self.flag_scan_ready:
             return None, None
-        self.write("INIT;:SYSTEM:TIME:SCAN?")
-        _ret = self.device.read().rstrip()
-        if verbose:
-            print("SCAN:", _ret)
+        if not self.flag_scan_started:
+            self.start_scan(verbose)
 
-        self.write("ROUTE:SCAN:SIZE?")
-        numberChannels = int(self.query("ROUTE:SCAN:SIZE?"))
-        points = 0
-        points_prev = 0
-        with tqdm(total=self.scan_count * numberChannels, leave=False, desc="[SCAN]") as pbar:
-            while points < self.scan_count * numberChannels:
-                sleep(0.01)
-                points = int(self.query("DATA:POINTS?"))
-                # print(points)
-                if points - points_prev > 0:
-                    pbar.update(points - points_prev)
-                    points_prev = points
-        ret = self.query("DATA:REMOVE? {0}".format(self.scan_count * numberChannels)).rstrip()
+        numberChannels = len(self.list_channel)
+        self.wait_scan(self.scan_count * numberChannels)
+        mat = self.device.query_ascii_values(
+            "DATA:REMOVE? {0}".format(self.scan_count * numberChannels), container=np.ndarray).reshape((-1, 3))
         if verbose:
-            print(ret)
-        mat = np.array(ret.split(sep=","), dtype=float).reshape((-1, 3))
-
-        list_data = []
-        for _chan in range(numberChannels):
-            list_data.append([])
-        for _i in range(mat.shape[0]):
-            for _i_chan, _chan in enumerate(self.list_channel):
-                if mat[_i, 2] == _chan:
-                    list_data[_i_chan].append([mat[_i, 1], mat[_i, 0]])
-
-        list_mat = []
-        for _data in list_data:
-            list_mat.append(np.array(_data))
+            print(mat)
 
-        return list_mat
+        # reading columns: value, time, channel -> per channel [time, value]
+        vec_chan = mat[:, 2].astype(int)
+        return [mat[vec_chan == _chan][:, [1, 0]] for _chan in self.list_channel]
 
     def scan_mean_std(self, verbose=False):
         _t, _val = self.scan_single_chan(verbose)
@@ -203,7 +267,7 @@ class Daq970a():
 if __name__ == "__main__":
     daq = Daq970a()
 
-    list_channel = [_i for _i in range(102, 111)]  # [101, 102, 103, ..., 110]
+    list_channel = list(range(102, 111))  # [101, 102, 103, ..., 110]
     daq.set_channel_volt_dc(list_channel)
     daq.setup_scan(20, 0.1)  # 20 counts, 0.1 [sec] interval
     ret = daq.scan_multi_chan()
@@ -1,3 +1,4 @@
+import atexit
 from ctypes import windll
 import serial.tools.list_ports
 from pathlib import Path
@@ -9,6 +10,7 @@ import matplotlib.pyplot as plt
 
 from module_SynthWrapper import Synth_Wrapper, Synth_Dummy
 from module_shot304gs import Shot304gs, Shot_304gs_dummy
+from module_nidaqmxWrapper import nidaqWrapper
 # import pandas as pd
 # import glob
 # import os
@@ -16,6 +18,7 @@ from module_shot304gs import Shot304gs, Shot_304gs_dummy
 SEC_TIMEOUT = 1000
 
 windll.winmm.timeBeginPeriod(1)
+atexit.register(windll.winmm.timeEndPeriod, 1)
 LIST_PORTS = list(serial.tools.list_ports.comports())
 
 system = nidaqmx.system.System.local()
@@ -71,9 +74,9 @@ def main_3d(filepath, freq_start, freq_end, freq_tick, dim_step, height_start, h
 
     list_index = []
     list_step = []
-    _list_index1 = [i for i in range(len(vec_height1))]
-    _list_index2 = [i for i in range(len(vec_height2))]
-    _list_index3 = [i for i in range(len(vec_height3))]
+    _list_index1 = list(range(len(vec_height1)))
+    _list_index2 = list(range(len(vec_height2)))
+    _list_index3 = list(range(len(vec_height3)))
     _rev_2 = False
     _rev_3 = False
 
@@ -99,8 +102,12 @@ def main_3d(filepath, freq_start, freq_end, freq_tick, dim_step, height_start, h
 
     plt.ion()
     fig, ax = plt.subplots(1, 1)
-    img = ax.imshow(np.zeros((len(vec_height1), len(vec_height2))))
-    cbar = fig.colorbar(img)
+    shape_preview = [_n for _n in shape_data if _n > 1][:2]
+    img = ax.imshow(np.zeros(shape_preview))
+    fig.colorbar(img)
+    clim_prev = (None, None)
+    # one task for the whole scan instead of creating and configuring it per frequency
+    daq = nidaqWrapper("Dev1/ai0", dummy=is_dummy)
     for _index in trange(len(list_index)):
         list_pulse = pulse_origin
         list_pulse[dim_step[0]] = list_step[_index][0]
@@ -112,26 +119,26 @@ def main_3d(filepath, freq_start, freq_end, freq_tick, dim_step, height_start, h
 
         for _i_freq, _freq in enumerate(tqdm(vec_freq, leave=False)):
             synth.on(power=15, frequency=_freq)
-            if is_dummy:
-                _voltage = np.random.rand(number_of_samples)
-            else:
-                with nidaqmx.Task() as task:
-                    task.ai_channels.add_ai_voltage_chan("Dev1/ai0")
-                    _voltage = task.read(number_of_samples_per_channel=number_of_samples)
+            _voltage = daq.read(number_of_samples)
             data[list_index[_index][0], list_index[_index][1], list_index[_index][2], _i_freq] = np.mean(_voltage)
 
-            plt.pause(0.001)
+            # keep the window responsive; the preview itself is redrawn once per position
+            fig.canvas.flush_events()
 
             synth.off()
-        plt.cla()
-        cbar.remove()
         _data = data.squeeze()
         while True:
             if len(_data.shape) < 3:
                 break
             _data = np.nanmean(_data, axis=-1)
-        img = ax.imshow(_data.squeeze())
-        cbar = fig.colorbar(img)
+        # update the existing artists instead of rebuilding the axes and colorbar
+        img.set_data(_data.squeeze())
+        # set_clim also redraws the colorbar, so only call it when the limits change
+        clim = (np.nanmin(_data), np.nanmax(_data))
+        if clim != clim_prev:
+            img.set_clim(*clim)
+            clim_prev = clim
+        plt.pause(0.001)
         if cnt_save > thres_save / len(vec_freq):
             np.savez(
                 filepath,
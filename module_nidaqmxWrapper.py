@@ -1,13 +1,15 @@
 import numpy as np
 import nidaqmx
 
-system = nidaqmx.system.System.local()
-print(system.driver_version)
-print("Devices:")
-if len(system.devices) == 0:
-    print("--- Nothing")
-for device in system.devices:
-    print("---", device)
+
+def print_devices():
+    system = nidaqmx.system.System.local()
+    print(system.driver_version)
+    print("Devices:")
+    if len(system.devices) == 0:
+        print("--- Nothing")
+    for device in system.devices:
+        print("---", device)
 
 
 def read_simple(chan="Dev1/ai0", number_of_samples=100, dummy=False):
@@ -49,5 +51,6 @@ class nidaqWrapper():
 
 
 if __name__ == "__main__":
+    print_devices()
     task = nidaqWrapper(dummy=True)
     # read_simple(dummy=True)
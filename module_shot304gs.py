@@ -18,7 +18,8 @@ class Shot304gs():
         self.device: Optional[pyvisa.resources.Resource] = None
         self.res_man = pyvisa.ResourceManager()
         num_device_suggest = 0
-        for _ind, _res in enumerate(self.res_man.list_resources()):
+        self.list_resources = self.res_man.list_resources()
+        for _ind, _res in enumerate(self.list_resources):
             print("Resource Manager>", _res)
             # Q:コマンド等を使ってSHOT304であることを確認するほうが良い
             if "GPIB" in _res:
@@ -34,7 +35,7 @@ class Shot304gs():
 
     def setup(self, num_device):
         self.device = self.res_man.open_resource(
-            self.res_man.list_resources()[num_device]
+            self.list_resources[num_device]
         )
         self.wait()
         self.set_NumberOfDivisions([4, 2, 2, 2])
@@ -52,9 +53,12 @@ class Shot304gs():
         # _start = time.perf_counter()
         if show:
             print("")
+        cnt_poll = 0
         while "B" in self.device.query("!:"):
-            if show:
+            # position query + print only every 10th poll
+            if show and cnt_poll % 10 == 0:
                 print("\r>> current position:", self.device.query("Q:").rstrip(), end="")
+            cnt_poll += 1
             time.sleep(0.01)
             # Timeout process
         if show:
@@ -19,7 +19,12 @@ class Shrc203():
         self.res_man = pyvisa.ResourceManager()
         num_device_suggest = None
 
-        for _ind, _res in enumerate(self.res_man.list_resources()):
+        self.list_resources = self.res_man.list_resources()
+        if num_device is not None:
+            self.setup(num_device)
+            return
+
+        for _ind, _res in enumerate(self.list_resources):
             print("SHRC203Wrapper>> Resource Manager>>", _res, end="", flush=True)
             # Q:コマンド等を使ってSHOT304であることを確認するほうが良い
             # if "ASRL" not in _res and "TCPIP" not in _res and "USB" not in _res and "GPIB" not in _res:
@@ -48,20 +53,16 @@ class Shrc203():
             else:
                 print(" -- Other device")
 
-        if num_device is not None:
-            self.setup(num_device)
-        if num_device_suggest is not None:
-            self.setup(num_device_suggest)
-
-        if num_device is None and num_device_suggest is None:
+        if num_device_suggest is None:
             raise ValueError("Could not find SHRC-203")
+        self.setup(num_device_suggest)
 
     def _exist_device(self):
         return self.device is not None
 
     def setup(self, num_device):
         self.device = self.res_man.open_resource(
-            self.res_man.list_resources()[num_device]
+            self.list_resources[num_device]
         )
         self.wait()
 
@@ -82,9 +83,9 @@ class Shrc203():
             return None
         if show:
             print("")
+        cnt_poll = 0
         while "B" in self.device.query("!:"):
-            time.sleep(0.01)
-            if show:
+            if show and cnt_poll % 10 == 0:
                 _msg = self.device.query("Q:Su").rstrip()
                 for _cut in ("\x00", "\r", "\n", " "):
                     _msg = _msg.replace(_cut, "")
@@ -96,6 +97,8 @@ class Shrc203():
                     list_status[2][1:], "um",
                     " " * 20,
                     end="")
+            cnt_poll += 1
+            time.sleep(0.01)
             # Timeout process
         if show:
             _msg = self.device.query("Q:Su").rstrip()